@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from textwrap import wrap
-
 from conversions import *
 from offsets import *
 
 STARTING_BOARD = list("rnbqkbnrpppppppp................................PPPPPPPPRNBQKBNR")
 STARTING_CASTLING_RIGHTS = list("KQkq")
+KING_HOME_POS = {"w": 60, "b": 4}
 
 class Move:
     def __init__(self, start_pos: int, end_pos: int) -> None:
@@ -33,11 +32,12 @@ class Board:
         castling_rights: list[str] = STARTING_CASTLING_RIGHTS,
         en_passant_square: int = 64,  # possible target square for en passant,
         tempi: int = 0,
-        moves: int = 0,
+        moves: int = 1,
         state: str = "p",
     ) -> None:
-        self.board = board
-        self.castling_rights = castling_rights
+        # copy so that boards never share (and mutate) the same lists
+        self.board = list(board)
+        self.castling_rights = list(castling_rights)
         self.turn = turn
         self.en_passant_target_pos = en_passant_square
         self.tempi = tempi
@@ -48,10 +48,25 @@ class Board:
         # 'w' -> white victory,
         # 'b' -> black victory
 
-    def reset(self):
-        self.board = STARTING_BOARD
-        self.castling_rights = STARTING_CASTLING_RIGHTS
+    def reset(self):  # reset in place, reusing the existing lists
+        self.board[:] = STARTING_BOARD
+        self.castling_rights[:] = STARTING_CASTLING_RIGHTS
         self.turn = "w"
+        self.en_passant_target_pos = 64
+        self.tempi = 0
+        self.moves = 1
+        self.state = "p"
+
+    def load_fen(self, fen: str) -> None:  # like reset(), but from an arbitrary position
+        # fen_to_board raises ValueError on a malformed FEN before anything is changed
+        board, turn, castling_rights, en_passant_square, tempi, moves = fen_to_board(fen)
+        self.board[:] = board
+        self.castling_rights[:] = castling_rights
+        self.turn = turn
+        self.en_passant_target_pos = en_passant_square
+        self.tempi = tempi
+        self.moves = moves
+        self.state = "p"
 
     def copy(self):
         return Board(
@@ -154,15 +169,24 @@ class Board:
                 continue
             threatmap.append(get_end_pos(start_pos, offset))
 
-        can_castle_sides = {"k": True, "q": True}
+        if start_pos != KING_HOME_POS[self.turn]:
+            return threatmap
         for side, offsets in king_offsets["castle"].items():
+            castling_right = side.upper() if self.turn == "w" else side
+            if castling_right not in self.castling_rights:
+                continue
+            rook = "R" if self.turn == "w" else "r"
+            if self.board[get_end_pos(start_pos, offsets["rook_start"])] != rook:
+                continue
+            can_castle = True
             for offset in offsets["between"]:
-                target_piece = self.board[get_end_pos(start_pos, offset)]
-                if target_piece != ".":
-                    can_castle_sides[side] = False
-        for side, can_castle in can_castle_sides.items():
-            if can_castle:
-                threatmap.append(get_end_pos(start_pos, king_offsets["castle"][side]["target"]))
+                if not offset_is_in_board(start_pos, offset) or self.board[get_end_pos(start_pos, offset)] != ".":
+                    can_castle = False
+            if not can_castle:
+                continue
+            for offset in offsets["target"]:
+                if offset_is_in_board(start_pos, offset):
+                    threatmap.append(get_end_pos(start_pos, offset))
 
         return threatmap
 
@@ -200,24 +224,25 @@ class Board:
             return []
 
         single_target_pos = get_end_pos(start_pos, single_offset)
-        print(self.board[single_target_pos])
         if self.board[single_target_pos] == ".":
             threatmap.append(single_target_pos)
             double_offset = offsets["double"]
-            if not offset_is_in_board(start_pos, double_offset):
-                return []
-            double_target_pos = get_end_pos(start_pos, double_offset)
             if (self.turn == "w" and board_y(start_pos) == 6) or (self.turn == "b" and board_y(start_pos) == 1):
+                double_target_pos = get_end_pos(start_pos, double_offset)
                 if self.board[double_target_pos] == ".":
                     threatmap.append(double_target_pos)
 
         for offset in offsets["captures"]:
+            if not offset_is_in_board(start_pos, offset):
+                continue
             capture_target_pos = get_end_pos(start_pos, offset)
             target_piece = self.board[capture_target_pos]
             if not self._piece_matches_turn(target_piece) and target_piece != ".":
                 threatmap.append(capture_target_pos)
 
         for offset in offsets["enpassant"]:
+            if not offset_is_in_board(start_pos, offset):
+                continue
             en_passant_target_pos = get_end_pos(start_pos, offset)
             if self.en_passant_target_pos == en_passant_target_pos:
                 threatmap.append(en_passant_target_pos)
@@ -250,9 +275,10 @@ class Board:
                 return []
 
     def pos_in_check(self, board: Board, pos: int) -> bool:
+        # `board` is the position after the move, so its turn is the attacking side
         for piece_pos, piece in enumerate(board.board):
-            if piece.lower() != "." and self._piece_matches_turn(piece):
-                if pos in self.threatmap(piece_pos):
+            if piece.lower() != "." and board._piece_matches_turn(piece):
+                if pos in board.threatmap(piece_pos):
                     return True
         return False
 
@@ -291,21 +317,25 @@ class Board:
             return self.get_player_move()
 
     def to_fen(self) -> str:
-        board_lines = wrap("".join(self.board))
-        fen_board = ""
-        for line in board_lines:
+        fen_ranks = []
+        for i in range(8):
+            fen_rank = ""
             count = 0
-            for piece in list(line):
+            for piece in self.board[8 * i : 8 * i + 8]:
                 if piece != ".":
-                    fen_board += str(piece)
                     if count != 0:
-                        fen_board += str(count)
+                        fen_rank += str(count)
+                    fen_rank += piece
                     count = 0
                 else:
                     count += 1
+            if count != 0:
+                fen_rank += str(count)
+            fen_ranks.append(fen_rank)
+        fen_board = "/".join(fen_ranks)
 
         turn = self.turn
-        castling_rights = "".join(self.castling_rights)
+        castling_rights = "".join(self.castling_rights) or "-"
         if self.en_passant_target_pos == 64:
             en_passant_target_square = "-"
         else:
@@ -335,27 +365,27 @@ class Board:
         self.board[promotion_pos] = piece
 
     def move_piece(self, move: Move) -> None:
-        # set last pawn double move to allow en passant
         moving_piece = self.board[move.start_pos]
         target_piece = self.board[move.end_pos]
-        self.en_passant_target_pos = 8
+        en_passant_target_pos = self.en_passant_target_pos
+        self.en_passant_target_pos = 64
         offset = move.end_pos - move.start_pos
+        promote = False
         if moving_piece.lower() == "p":
-            # set `en_passant_target_pos`
             self.tempi = 0
+            # set last pawn double move to allow en passant
             if offset == -16 or offset == 16:
-                if self.turn == "w":
-                    self.en_passant_target_pos = move.end_pos - 8
-                else:
-                    self.en_passant_target_pos = move.end_pos + 8
-            # promotion
+                self.en_passant_target_pos = move.start_pos + offset // 2
+            # en passant, the captured pawn is beside the start square, not on the end square
+            if move.end_pos == en_passant_target_pos:
+                captured_pos = move.end_pos + 8 if self.turn == "w" else move.end_pos - 8
+                self.board[captured_pos] = "."
             target_y = board_y(move.end_pos)
-            if target_y == 0 or target_y == 7:
-                self._promote(move.start_pos)
-        elif self.board[move.end_pos] != ".":
+            promote = target_y == 0 or target_y == 7
+        elif target_piece != ".":
             self.tempi = 0
         else:
-            self.tempi = 0
+            self.tempi += 1
 
         if self.turn == "b":
             self.moves += 1
@@ -363,24 +393,36 @@ class Board:
         if self.tempi >= 100:
             self._offer_draw()
 
+        # castling, the king has already been checked to move two squares from its home square
+        if moving_piece.lower() == "k" and abs(offset) == 2:
+            castle_offsets = king_offsets["castle"]["k" if offset > 0 else "q"]
+            rook_start_pos = get_end_pos(move.start_pos, castle_offsets["rook_start"])
+            rook_end_pos = get_end_pos(move.start_pos, castle_offsets["rook_end"])
+            self.board[rook_end_pos] = self.board[rook_start_pos]
+            self.board[rook_start_pos] = "."
+
+        def revoke_castling_right(right):
+            if right in self.castling_rights:
+                self.castling_rights.remove(right)
+
         if moving_piece.lower() == "k":
             if self.turn == "w":
-                self.castling_rights.remove("K")
-                self.castling_rights.remove("Q")
+                revoke_castling_right("K")
+                revoke_castling_right("Q")
             else:
-                self.castling_rights.remove("k")
-                self.castling_rights.remove("q")
+                revoke_castling_right("k")
+                revoke_castling_right("q")
 
         def rook_revoke_castling_rights(rook_pos):
             match rook_pos:
                 case 0:
-                    self.castling_rights.remove("q")
+                    revoke_castling_right("q")
                 case 7:
-                    self.castling_rights.remove("k")
+                    revoke_castling_right("k")
                 case 56:
-                    self.castling_rights.remove("Q")
+                    revoke_castling_right("Q")
                 case 63:
-                    self.castling_rights.remove("K")
+                    revoke_castling_right("K")
 
         if moving_piece.lower() == 'r':
             rook_revoke_castling_rights(move.start_pos)
@@ -389,4 +431,6 @@ class Board:
 
         self.board[move.end_pos] = moving_piece
         self.board[move.start_pos] = "."
+        if promote:
+            self._promote(move.end_pos)
         self.change_turn()
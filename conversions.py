@@ -17,7 +17,7 @@ def pos_to_notation_square(pos):
         6:"g",
         7:"h",
     }
-    return NotationSquare(num_to_char[board_x(pos)] + str(board_y(pos))).square
+    return NotationSquare(num_to_char[board_x(pos)] + str(8 - board_y(pos))).square
 
 
 class NotationSquare:  # A square in traditional chess notation, e.g. `d4`
@@ -52,21 +52,37 @@ class NotationSquare:  # A square in traditional chess notation, e.g. `d4`
         ]
 
 def fen_to_board(fen: str):
+    # raises ValueError for a malformed FEN
     fen_list = fen.split(' ')
+    if len(fen_list) != 6:
+        raise ValueError(f"FEN has {len(fen_list)} fields, expected 6: {fen!r}")
     board, turn, castling_rights, en_passant_target_pos, tempi, moves = fen_list
     board = list(board.replace('/', ''))
     for i, char in enumerate(board):
         if char.isnumeric():
             board[i] = '.' * int(char)
     board = list(''.join(board))
+    if len(board) != 64:
+        raise ValueError(f"FEN board has {len(board)} squares, expected 64: {fen!r}")
+    if not set(board) <= set("kqbnrpKQBNRP."):
+        raise ValueError(f"FEN board has invalid pieces: {fen!r}")
+
+    if turn not in ['w', 'b']:
+        raise ValueError(f"FEN has invalid turn {turn!r}: {fen!r}")
+
+    # turn and castling_rights are of the same format, except for no castling rights
+    castling_rights = [] if castling_rights == '-' else list(castling_rights)
+    if not set(castling_rights) <= set("KQkq") or len(set(castling_rights)) != len(castling_rights):
+        raise ValueError(f"FEN has invalid castling rights: {fen!r}")
 
-    # turn and castling_rights are of the same format
     if en_passant_target_pos == '-':
         en_passant_target_pos = 64
     else:
+        if len(en_passant_target_pos) != 2 or not NotationSquare(en_passant_target_pos).is_valid_notation():
+            raise ValueError(f"FEN has invalid en passant square: {fen!r}")
         en_passant_target_pos = NotationSquare(en_passant_target_pos).to_pos()
 
     tempi = int(tempi)
     moves = int(moves)
 
-    return board, str(turn), list(castling_rights), en_passant_target_pos, tempi, moves
+    return board, str(turn), castling_rights, en_passant_target_pos, tempi, moves
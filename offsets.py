@@ -21,7 +21,7 @@ def offset_is_in_board(start_pos: int, xy_offset: dict[str, int]) -> bool:
     }
     x = xy_pos["x"] + xy_offset["x"]
     y = xy_pos["y"] + xy_offset["y"]
-    return not (x > 7 or x < 0 or y > 7 or x < 0)
+    return not (x > 7 or x < 0 or y > 7 or y < 0)
 
 
 knight_offsets = [
@@ -49,19 +49,25 @@ king_offsets = {
         'k': {
             'between': [  # could hardcode positions
                 {"x": 1, "y": 0},
+                {"x": 2, "y": 0},
             ],
             'target': [
                 {"x": 2, "y": 0},
             ],
+            'rook_start': {"x": 3, "y": 0},
+            'rook_end': {"x": 1, "y": 0},
         },
         'q': {
             'between': [
                 {"x": -1, "y": 0},
                 {"x": -2, "y": 0},
+                {"x": -3, "y": 0},
             ],
             'target': [
-                {"x": -3, "y": 0},
+                {"x": -2, "y": 0},
             ],
+            'rook_start': {"x": -4, "y": 0},
+            'rook_end': {"x": -1, "y": 0},
         },
     }
 }
@@ -154,8 +160,8 @@ def pawn_offsets(turn: str) -> dict:
                 {"x": 1, "y": -1},
             ],
             "enpassant": [
-                {"x": -1, "y": -2},
-                {"x": 1, "y": -2},
+                {"x": -1, "y": -1},
+                {"x": 1, "y": -1},
             ],
         }
     else:
@@ -167,7 +173,7 @@ def pawn_offsets(turn: str) -> dict:
                 {"x": 1, "y": 1},
             ],
             "enpassant": [
-                {"x": -1, "y": 2},
-                {"x": 1, "y": 2},
+                {"x": -1, "y": 1},
+                {"x": 1, "y": 1},
             ],
         }
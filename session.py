@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import sys
+
+from board import Board, Move
+
+
+class SessionManager:
+    # Owns a pool of preallocated boards, one per concurrent game.
+    # Boards are reset in place when a session is opened, so opening and
+    # closing sessions doesn't allocate new boards once the pool is warm.
+    # A board returned by get_board() is only owned by the caller until
+    # close_session(); after that it goes back to the pool and will be reset
+    # and handed to the next session, so callers must drop their reference.
+    def __init__(self, pool_size: int = 64) -> None:
+        self.free_boards = [Board() for _ in range(pool_size)]
+        self.sessions: dict[int, Board] = {}
+        self.next_session_id = 0
+
+    def open_session(self, fen: str | None = None) -> int:
+        board = self.free_boards.pop() if self.free_boards else Board()
+        if fen is None:
+            board.reset()
+        else:
+            try:
+                board.load_fen(fen)
+            except ValueError:
+                self.free_boards.append(board)
+                raise
+        session_id = self.next_session_id
+        self.next_session_id += 1
+        self.sessions[session_id] = board
+        return session_id
+
+    def close_session(self, session_id: int) -> None:
+        self.free_boards.append(self.sessions.pop(session_id))
+
+    def get_board(self, session_id: int) -> Board:
+        return self.sessions[session_id]
+
+    def apply_move(self, session_id: int, move: Move) -> bool:
+        board = self.sessions[session_id]
+        if board.state != "p":
+            return False
+        if not (0 <= move.start_pos < 64 and 0 <= move.end_pos < 64):
+            return False
+        if move.end_pos not in board.threatmap(move.start_pos):
+            return False
+        if board.move_causes_check(move):
+            return False
+        board.move_piece(move)
+        return True
+
+    def session_memory(self, session_id: int) -> int:  # in bytes
+        return board_memory(self.sessions[session_id])
+
+    def memory_per_session(self) -> dict[int, int]:
+        return {session_id: board_memory(board) for session_id, board in self.sessions.items()}
+
+
+def board_memory(board: Board) -> int:
+    # the board's own footprint plus the containers it exclusively owns;
+    # interned piece strings and small ints are shared, so aren't counted
+    return (
+        sys.getsizeof(board)
+        + sys.getsizeof(board.__dict__)
+        + sys.getsizeof(board.board)
+        + sys.getsizeof(board.castling_rights)
+    )
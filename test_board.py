@@ -0,0 +1,126 @@
+import pytest
+
+from board import STARTING_BOARD, STARTING_CASTLING_RIGHTS, Board, Move
+
+
+def test_boards_do_not_share_state():
+    board = Board()
+    other = Board()
+    board.move_piece(Move(52, 36))
+    board.move_piece(Move(12, 28))
+    board.move_piece(Move(60, 52))
+    assert other.board == list("rnbqkbnrpppppppp................................PPPPPPPPRNBQKBNR")
+    assert other.castling_rights == list("KQkq")
+    assert STARTING_BOARD == other.board
+    assert STARTING_CASTLING_RIGHTS == other.castling_rights
+
+
+def test_move_causes_check_leaves_board_untouched():
+    board = Board()
+    before = list(board.board)
+    board.move_causes_check(Move(52, 36))
+    assert board.board == before
+    assert board.turn == "w"
+
+
+def test_reset_and_load_fen_reuse_lists():
+    board = Board()
+    squares, castling_rights = board.board, board.castling_rights
+    board.move_piece(Move(52, 36))
+    board.reset()
+    assert board.board is squares and board.castling_rights is castling_rights
+    assert board.board == STARTING_BOARD
+
+    board.load_fen("4k3/8/8/8/8/8/8/4K3 w - - 0 1")
+    assert board.board is squares and board.castling_rights is castling_rights
+    assert board.castling_rights == []
+    assert board.board.count(".") == 62
+
+
+def test_load_fen_rejects_short_board():
+    board = Board()
+    with pytest.raises(ValueError):
+        board.load_fen("rnbqkbnr/pppppppp/8/8 w KQkq - 0 1")
+    assert board.board == STARTING_BOARD
+
+
+def test_repeated_rook_moves_keep_castling_rights_consistent():
+    board = Board()
+    for move in [Move(62, 45), Move(1, 18), Move(63, 62), Move(18, 1), Move(62, 63), Move(1, 18), Move(63, 62)]:
+        assert move.end_pos in board.threatmap(move.start_pos)
+        board.move_piece(move)
+    assert board.castling_rights == list("Qkq")
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNX w KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR x KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkx - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq z9 0 1",
+    ],
+)
+def test_load_fen_rejects_malformed_fen(fen):
+    board = Board()
+    with pytest.raises(ValueError):
+        board.load_fen(fen)
+    assert board.board == STARTING_BOARD
+    assert board.castling_rights == STARTING_CASTLING_RIGHTS
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e6 0 2",
+        "r3k2r/8/8/8/8/8/8/R3K2R b Kq - 12 40",
+        "4k3/8/8/8/8/8/8/4K3 w - - 0 1",
+    ],
+)
+def test_to_fen_round_trips(fen):
+    board = Board()
+    board.load_fen(fen)
+    assert board.to_fen() == fen
+    assert Board().to_fen() == "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+
+def test_castling_moves_the_rook():
+    board = Board()
+    board.load_fen("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+    assert 62 in board.threatmap(60) and 58 in board.threatmap(60)
+    board.move_piece(Move(60, 62))
+    assert "".join(board.board[56:]) == "R....RK."
+    assert 2 in board.threatmap(4)
+    board.move_piece(Move(4, 2))
+    assert "".join(board.board[:8]) == "..kr...r"
+    assert board.castling_rights == []
+
+
+def test_castling_needs_empty_squares_and_home_king():
+    board = Board()
+    board.load_fen("4k3/8/8/8/8/8/8/RN2KB1R w KQ - 0 1")
+    assert board.threatmap(60) == [53, 52, 51, 59]
+    board.load_fen("4k3/8/8/8/4K3/8/8/R6R w KQ - 0 1")
+    assert not {34, 38} & set(board.threatmap(36))
+
+
+def test_en_passant():
+    board = Board()
+    board.load_fen("4k3/p7/8/1P6/8/8/8/4K3 b - - 0 1")
+    board.move_piece(Move(4, 3))
+    assert board.threatmap(25) == [17]
+    board.load_fen("4k3/p7/8/1P6/8/8/8/4K3 b - - 0 1")
+    board.move_piece(Move(8, 24))
+    assert board.to_fen() == "4k3/8/8/pP6/8/8/8/4K3 w - a6 0 2"
+    assert board.threatmap(25) == [17, 16]
+    board.move_piece(Move(25, 16))
+    assert board.to_fen() == "4k3/8/P7/8/8/8/8/4K3 b - - 0 2"
+
+
+def test_promotion():
+    board = Board()
+    board.load_fen("4k3/P7/8/8/8/8/8/4K3 w - - 0 1")
+    board.move_piece(Move(8, 0))
+    assert board.board[0] == "Q" and board.board[8] == "."
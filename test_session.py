@@ -0,0 +1,73 @@
+import pytest
+
+from board import STARTING_BOARD, Move
+from session import SessionManager
+
+
+def test_closed_session_board_is_reused():
+    manager = SessionManager(pool_size=1)
+    session_id = manager.open_session()
+    board = manager.get_board(session_id)
+    assert manager.apply_move(session_id, Move(52, 36))
+    manager.close_session(session_id)
+
+    new_session_id = manager.open_session()
+    assert manager.get_board(new_session_id) is board
+    assert board.board == STARTING_BOARD
+    assert board.turn == "w"
+
+
+def test_king_move_is_applied():
+    manager = SessionManager(pool_size=1)
+    session_id = manager.open_session("4k3/8/8/8/8/8/8/4K3 w - - 0 1")
+    assert manager.apply_move(session_id, Move(60, 59))
+    assert manager.get_board(session_id).board[59] == "K"
+
+
+def test_bad_moves_return_false():
+    manager = SessionManager(pool_size=1)
+    session_id = manager.open_session()
+    assert not manager.apply_move(session_id, Move(52, 64))
+    assert not manager.apply_move(session_id, Move(-1, 36))
+    assert not manager.apply_move(session_id, Move(52, 28))
+    manager.get_board(session_id).state = "d"
+    assert not manager.apply_move(session_id, Move(52, 36))
+
+
+def test_memory_per_session():
+    manager = SessionManager(pool_size=2)
+    session_ids = [manager.open_session(), manager.open_session()]
+    memory = manager.memory_per_session()
+    assert sorted(memory) == session_ids
+    assert all(size > 0 for size in memory.values())
+
+
+def test_castling_on_both_sides():
+    manager = SessionManager(pool_size=1)
+    session_id = manager.open_session("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+    board = manager.get_board(session_id)
+    assert manager.apply_move(session_id, Move(60, 62))
+    assert manager.apply_move(session_id, Move(4, 2))
+    assert "".join(board.board[:8]) == "..kr...r"
+    assert "".join(board.board[56:]) == "R....RK."
+
+
+def test_moves_into_or_staying_in_check_are_rejected():
+    manager = SessionManager(pool_size=1)
+    session_id = manager.open_session("4k3/8/8/8/8/8/8/3rK3 w - - 0 1")
+    # the king can't step onto the rook's file
+    assert not manager.apply_move(session_id, Move(60, 51))
+    assert manager.apply_move(session_id, Move(60, 52))
+
+    session_id = manager.open_session("4r1k1/8/8/8/8/8/3P4/4K3 w - - 0 1")
+    # a pawn move that leaves the king in check
+    assert not manager.apply_move(session_id, Move(51, 43))
+    assert manager.apply_move(session_id, Move(60, 61))
+
+
+def test_bad_fen_returns_board_to_pool():
+    manager = SessionManager(pool_size=2)
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            manager.open_session("rnbqkbnr/pppppppp/8/8 w KQkq - 0 1")
+    assert len(manager.free_boards) == 2